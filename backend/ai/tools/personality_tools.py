@@ -12,13 +12,14 @@ from backend.ai.client import DualAIClient
 
 logger = logging.getLogger(__name__)
 
-VALID_TRAITS = {
+VALID_TRAITS = frozenset({
     "openness",
     "conscientiousness",
     "extraversion",
     "agreeableness",
     "neuroticism",
-}
+})
+VALID_DIRECTIONS = frozenset({1, -1})
 
 LIKERT_OPTIONS = [
     {"value": 1, "label": "Disagree strongly"},
@@ -29,14 +30,19 @@ LIKERT_OPTIONS = [
 ]
 TRAITS = ["openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"]
 
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*", re.IGNORECASE)
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+
 class PersonalityTools:
     """Tools for AI to generate personality assessments"""
 
     @staticmethod
     def _strip_code_fences(text: str) -> str:
         cleaned = text.strip()
-        cleaned = re.sub(r"^```(?:json)?\s*", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s*```$", "", cleaned)
+        cleaned = _FENCE_OPEN_RE.sub("", cleaned)
+        cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
         return cleaned.strip()
 
     @staticmethod
@@ -58,8 +64,8 @@ class PersonalityTools:
 
         # 2) Try extracting JSON object/list from mixed text
         candidates = []
-        candidates.extend(re.findall(r"\{[\s\S]*\}", cleaned))
-        candidates.extend(re.findall(r"\[[\s\S]*\]", cleaned))
+        candidates.extend(_JSON_OBJECT_RE.findall(cleaned))
+        candidates.extend(_JSON_ARRAY_RE.findall(cleaned))
         for candidate in candidates:
             try:
                 return json.loads(candidate)
@@ -109,7 +115,7 @@ class PersonalityTools:
                 direction_int = int(direction)
             except (TypeError, ValueError):
                 continue
-            if direction_int not in (1, -1):
+            if direction_int not in VALID_DIRECTIONS:
                 continue
 
             normalized.append(
@@ -156,10 +162,10 @@ class PersonalityTools:
         rng = random.SystemRandom()
         selected: List[Dict[str, Any]] = []
 
+        # sample() draws only the k items needed; SystemRandom pays an
+        # os.urandom read per draw, so shuffling whole pools is wasteful.
         for trait in traits:
-            pool = by_trait[trait][:]
-            rng.shuffle(pool)
-            selected.extend(pool[:per_trait_target])
+            selected.extend(rng.sample(by_trait[trait], per_trait_target))
 
         remainder = num_questions - len(selected)
         if remainder > 0:
@@ -171,8 +177,7 @@ class PersonalityTools:
                     if key not in used_texts:
                         leftovers.append(q)
                         used_texts.add(key)
-            rng.shuffle(leftovers)
-            selected.extend(leftovers[:remainder])
+            selected.extend(rng.sample(leftovers, min(remainder, len(leftovers))))
 
         rng.shuffle(selected)
         return selected[:num_questions]
@@ -138,6 +138,11 @@ async def get_db():
             raise
 
 
+# Same session lifecycle as get_db, for scripts outside FastAPI's DI:
+#     async with get_db_context() as db: ...
+get_db_context = asynccontextmanager(get_db)
+
+
 # ==================================================
 # Health Check
 # ==================================================
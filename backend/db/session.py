@@ -7,7 +7,8 @@ from backend.db.database import (
     engine,
     AsyncSessionLocal as async_session,
     Base,
-    get_db
+    get_db,
+    get_db_context,
 )
 
-__all__ = ["engine", "async_session", "Base", "get_db"]
\ No newline at end of file
+__all__ = ["engine", "async_session", "Base", "get_db", "get_db_context"]
\ No newline at end of file
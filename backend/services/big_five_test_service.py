@@ -696,37 +696,35 @@ class BigFiveTestService:
         - For negative direction questions: score = 6 - response value
         - Final score = (sum / max_possible) * 100
         """
-        trait_scores = {
-            "openness": [],
-            "conscientiousness": [],
-            "extraversion": [],
-            "agreeableness": [],
-            "neuroticism": []
+        # Running per-trait totals; a single pass over the responses
+        trait_sums = {
+            "openness": 0,
+            "conscientiousness": 0,
+            "extraversion": 0,
+            "agreeableness": 0,
+            "neuroticism": 0
         }
+        trait_counts = dict.fromkeys(trait_sums, 0)
         
         for r in responses:
             trait = r["trait"]
-            direction = r["direction"]
             response = r["response"]
             
-            # Normalize score (1-5 scale)
-            if direction == 1:
-                normalized = response
-            else:
-                normalized = 6 - response  # Reverse scoring
+            # Normalize score (1-5 scale), reverse scoring negative items
+            normalized = response if r["direction"] == 1 else 6 - response
             
-            trait_scores[trait].append(normalized)
+            trait_sums[trait] += normalized
+            trait_counts[trait] += 1
         
-        all_normalized_values: List[float] = []
-        for scores in trait_scores.values():
-            all_normalized_values.extend(scores)
-        overall_avg = (sum(all_normalized_values) / len(all_normalized_values)) if all_normalized_values else 3.0
+        total_count = len(responses)
+        overall_avg = (sum(trait_sums.values()) / total_count) if total_count else 3.0
 
         final_scores = {}
-        for trait, scores in trait_scores.items():
-            if scores:
+        for trait, total in trait_sums.items():
+            count = trait_counts[trait]
+            if count:
                 # Average of 1-5 scale, converted to 0-100
-                avg = sum(scores) / len(scores)
+                avg = total / count
                 final_scores[trait] = int(((avg - 1) / 4) * 100)
             else:
                 # Dynamic fallback from the current test response profile, not a hardcoded constant
@@ -1324,9 +1324,9 @@ class EnhancedAIIntelligenceService:
                 )
                 
                 db.add(score_record)
-                await db.commit()
                 
-                # Update RealTimeMetrics with the new score
+                # Update RealTimeMetrics with the new score; committed together
+                # with the score record in one transaction
                 metrics = await db.execute(
                     select(RealTimeMetrics).where(RealTimeMetrics.user_id == user_id)
                 )
@@ -1335,8 +1335,9 @@ class EnhancedAIIntelligenceService:
                 if metrics_record:
                     metrics_record.focus_score = current_score['score']
                     metrics_record.updated_at = datetime.utcnow()
-                    await db.commit()
-                    
+                await db.commit()
+                
+                if metrics_record:
                     # Broadcast the update to real-time systems
                     try:
                         from backend.realtime.socket_manager import broadcast_analytics_update
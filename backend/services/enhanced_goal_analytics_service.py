@@ -849,9 +849,7 @@ class EnhancedGoalAnalyticsService:
                     goal.current_progress = max(goal.current_progress or 0, round(new_progress))
                     goal.updated_at = datetime.utcnow()
                     
-                    await db.commit()
-                    
-                    # Log the analytics event
+                    # Log the analytics event in the same transaction
                     analytics_event = AnalyticsEvent(
                         user_id=int(user_id),
                         event_type=f"goal_progress_updated_realtime",
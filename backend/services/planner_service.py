@@ -643,8 +643,8 @@ class PlannerService:
     # TASKS CRUD (for API & AI tools)
     # ─────────────────────────────────────────────────────────────
 
-    async def start_task(self, user_id: str, task_id: str) -> dict[str, Any]:
-        """Start a task (initial start or retry)."""
+    async def start_task(self, user_id: str, task_id: str) -> Optional[dict[str, Any]]:
+        """Start a task (initial start or retry). Returns None if it cannot be started."""
         from backend.db.models import Task
         from sqlalchemy import select
         
@@ -656,7 +656,7 @@ class PlannerService:
                 )
                 task = result.scalar_one_or_none()
                 if not task:
-                    raise Exception("Task not found")
+                    return None
 
                 # Update metadata
                 meta = dict(task.meta or {})
@@ -691,8 +691,8 @@ class PlannerService:
 
                 return self._task_to_dict(task)
         except Exception as e:
-            logger.error(f"Failed to start task: {e}")
-            return {"error": str(e)}
+            logger.error(f"Failed to start task {task_id}: {e}")
+            return None
     
     async def create_task(self, user_id: str, task_data: Any) -> Any:
         """Create a new task."""
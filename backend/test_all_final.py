@@ -1,9 +1,4 @@
 import asyncio
-import sys
-import os
-
-# Add the backend directory to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 async def test_all():
     from backend.services.planner_service import planner_service
@@ -1,12 +1,8 @@
 import asyncio
 import logging
-import sys
-import os
+import traceback
 from datetime import datetime, timedelta, timezone
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
 from backend.db.database import get_db
 from backend.services.analytics_service import analytics_service
 from backend.services.behavior_timeline_service import behavior_timeline_service
@@ -29,7 +25,6 @@ async def test_analytics_components():
         print(f"✅ Timeline OK (Days: {len(data.get('timeline', []))})")
     except Exception as e:
         print(f"❌ Timeline Error: {e}")
-        import traceback
         traceback.print_exc()
 
     # 2. Goal Analytics
@@ -55,7 +50,6 @@ async def test_analytics_components():
             
     except Exception as e:
         print(f"❌ Goal Analytics Error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
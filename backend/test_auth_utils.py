@@ -7,10 +7,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 password = "a" * 80
 hashed = pwd_context.hash(password[:72]) # Create a valid hash for truncated password
 
+buf = [f"Testing verify_password with length {len(password)}"]
+try:
+    result = verify_password(password, hashed)
+    buf.append(f"Result: {result}")
+except Exception as e:
+    buf.append(f"Error: {e}")
+
 with open("result_auth_utils.txt", "w") as f:
-    f.write(f"Testing verify_password with length {len(password)}\n")
-    try:
-        result = verify_password(password, hashed)
-        f.write(f"Result: {result}\n")
-    except Exception as e:
-        f.write(f"Error: {e}\n")
+    f.write("\n".join(buf) + "\n")
@@ -1,10 +1,6 @@
 import asyncio
 import logging
-import sys
-import os
-
-# Add project root to path
-sys.path.append(os.getcwd())
+import traceback
 
 from backend.services.big_five_test_service import big_five_test_service
 from backend.db.database import get_db
@@ -39,7 +35,6 @@ async def test_big_five_start():
                 
         except Exception as e:
             f.write(f"❌ Exception caught: {e}\n")
-            import traceback
             f.write(traceback.format_exc())
 
 if __name__ == "__main__":
@@ -1,32 +1,34 @@
 from passlib.context import CryptContext
 
+buf = ["Starting truncate test 71"]
+
 try:
-    with open("result_truncate_71.txt", "w") as f:
-        f.write("Starting truncate test 71\n")
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    long_password = "a" * 80
+    
+    # Simulate truncation logic
+    password_bytes = long_password.encode('utf-8')
+    if len(password_bytes) >= 72: # Truncate if >= 72 just in case
+        truncated_pw = password_bytes[:71]
+    else:
+        truncated_pw = long_password
         
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        long_password = "a" * 80
+    buf.append(f"Truncated type: {type(truncated_pw)}")
+    buf.append(f"Truncated length: {len(truncated_pw)}")
+
+    hash_ = pwd_context.hash(truncated_pw)
+    buf.append(f"Hash created successfully: {hash_}")
+    
+    # Verify
+    v = pwd_context.verify(truncated_pw, hash_)
+    buf.append(f"Verify result: {v}")
         
-        try:
-            # Simulate truncation logic
-            password_bytes = long_password.encode('utf-8')
-            if len(password_bytes) >= 72: # Truncate if >= 72 just in case
-                truncated_pw = password_bytes[:71]
-            else:
-                truncated_pw = long_password
-                
-            f.write(f"Truncated type: {type(truncated_pw)}\n")
-            f.write(f"Truncated length: {len(truncated_pw)}\n")
+except Exception as e:
+    buf.append(f"Failed with error: {e}")
 
-            hash_ = pwd_context.hash(truncated_pw)
-            f.write(f"Hash created successfully: {hash_}\n")
-            
-            # Verify
-            v = pwd_context.verify(truncated_pw, hash_)
-            f.write(f"Verify result: {v}\n")
-                
-        except Exception as e:
-            f.write(f"Failed with error: {e}\n")
-            
+try:
+    # Single write so the whole report lands in one syscall
+    with open("result_truncate_71.txt", "w") as f:
+        f.write("\n".join(buf) + "\n")
 except Exception as e:
     print(f"File writing failed: {e}")
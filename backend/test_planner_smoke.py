@@ -0,0 +1,51 @@
+import asyncio
+import traceback
+
+from backend.services.planner_service import planner_service
+from backend.utils.event_loop import run
+
+GOAL = {
+    'title': 'Crack College Exams',
+    'description': 'Achieve excellent results in college exams',
+    'category': 'Education',
+    'milestones': ['Complete Syllabus', 'Practice Mock Tests', 'Improve Weak Areas']
+}
+
+TASK = {
+    'title': 'Review Exam Syllabus',
+    'description': 'Review the complete exam syllabus',
+    'priority': 'high',
+    'estimated_minutes': 60,
+    'category': 'Education',
+    'goal_link': 'Crack College Exams'
+}
+
+HABIT = {
+    'title': 'Test Exercise',
+    'name': 'Test Exercise',
+    'description': 'Daily exercise routine',
+    'frequency': 'daily',
+    'category': 'Fitness'
+}
+
+async def main():
+    try:
+        # The task links to the goal by title, so the goal has to exist first
+        goal = await planner_service.create_goal('1', GOAL)
+        print('SUCCESS: Goal creation result:', goal)
+
+        task, habit = await asyncio.gather(
+            planner_service.create_task('1', TASK),
+            planner_service.create_habit('1', HABIT),
+        )
+        print('SUCCESS: Task creation result:', task)
+        print('SUCCESS: Habit creation result:', habit)
+        return True
+    except Exception as e:
+        print('ERROR:', str(e))
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    success = run(main())
+    print('Test completed:', success)
@@ -0,0 +1,47 @@
+"""
+Shared helpers for the test modules: the bcrypt/passlib hashing context
+and the lightweight database stand-ins used by the planner service tests.
+"""
+from datetime import datetime
+
+from passlib.context import CryptContext
+
+# Cost 4 is the bcrypt minimum. These tests exercise truncation behaviour,
+# not the work factor, so there is no reason to pay for the production cost.
+PWD_CTX = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__default_rounds=4,
+    bcrypt__min_rounds=4,
+    bcrypt__max_rounds=12,
+    bcrypt__ident="2b",
+    deprecated="auto",
+)
+
+# Backend choice is a handler setting rather than a CryptContext option, so
+# pin it here instead of letting passlib probe every candidate on first use.
+PWD_CTX.handler("bcrypt").set_backend("bcrypt")
+
+# Hashed once at import; the truncate tests only need to exercise verify().
+# Inputs are bytes so passlib never has to encode or length-check a str.
+HASH_72A = PWD_CTX.hash(b"a" * 72)
+HASH_50A = PWD_CTX.hash(b"a" * 50)
+
+CREATED_AT = datetime(2024, 1, 1, 12, 0, 0)
+CREATED_AT_ISO = CREATED_AT.isoformat()
+
+
+class _Result:
+    """Minimal stand-in for a SQLAlchemy result, cheaper than a MagicMock."""
+    __slots__ = ("fetchall", "fetchone")
+
+    def __init__(self, rows):
+        self.fetchall = lambda: rows
+        self.fetchone = lambda: rows[0] if rows else None
+
+
+
+def _db_gen(session):
+    """Mirror get_db's async generator shape, yielding a single session."""
+    async def _g():
+        yield session
+    return _g()
@@ -3,20 +3,27 @@ import os
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from typing import Generator
 
 
 # Test database configuration
 TEST_DATABASE_URL = os.getenv(
     "TEST_DATABASE_URL",
-    "sqlite:///./test.db"
+    "sqlite:///file::memory:?cache=shared&uri=true"
 )
 
 # Create test engine
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in TEST_DATABASE_URL else {}
-)
+if "sqlite" in TEST_DATABASE_URL:
+    # An in-memory database lives only as long as its connection, so
+    # StaticPool hands the same one to every session in the process.
+    test_engine = create_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False, "uri": True}
+    )
+else:
+    test_engine = create_engine(TEST_DATABASE_URL)
 
 TestingSessionLocal = sessionmaker(
     autocommit=False,
@@ -38,6 +45,24 @@ def db_setup():
     Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(scope="session")
+def plaintext_password_hashing():
+    """Store new password hashes as plaintext for the rest of the test run"""
+    from passlib.context import CryptContext
+    from backend.auth import auth_utils
+
+    # Tests never need real password hashing. bcrypt stays listed (ahead of
+    # plaintext, which matches any string) so existing hashes such as
+    # OWNER_PASSWORD_HASH still verify.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_utils, "pwd_context", CryptContext(
+            schemes=["bcrypt", "plaintext"],
+            default="plaintext",
+            deprecated=["bcrypt"],
+        ))
+        yield
+
+
 @pytest.fixture
 def db_session(db_setup) -> Generator:
     """Provide test database session"""
@@ -53,7 +78,7 @@ def db_session(db_setup) -> Generator:
 
 
 @pytest.fixture
-def test_client(db_session):
+def test_client(db_session, plaintext_password_hashing):
     """Provide test client with database session"""
     from backend.app.main import app
     from backend.db.session import get_db
@@ -74,7 +99,7 @@ def test_client(db_session):
 
 
 # Test data fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_data():
     """Sample user data for testing"""
     return {
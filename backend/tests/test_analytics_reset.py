@@ -1,12 +1,14 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
+from freezegun import freeze_time
 from backend.services.analytics_service import analytics_service
 from backend.db.models import RealTimeMetrics
 from backend.db.session import get_db
 
 @pytest.mark.asyncio
+@freeze_time("2024-06-15 12:00:00")
 async def test_daily_metrics_reset(db_session):
     """
     Test that daily metrics are reset when a new event occurs on a new day.
@@ -20,7 +22,9 @@ async def test_daily_metrics_reset(db_session):
     # but let's try to inject directly if possible or use service to init.
     
     # Just insert a dummy metric row directly
-    yesterday = datetime.utcnow() - timedelta(days=1)
+    # The clock is frozen at 2024-06-15 12:00 UTC, so this is always "yesterday"
+    # regardless of when the suite runs.
+    yesterday = datetime(2024, 6, 14, 12)
     
     metric = RealTimeMetrics(
         user_id=user_id,
@@ -0,0 +1,58 @@
+"""
+bcrypt / passlib behaviour checks.
+
+Consolidates the old standalone probe scripts (test_bcrypt.py,
+test_passlib_behavior.py, test_passlib_truncate*.py, test_short.py) so that
+a single interpreter and a single CryptContext cover every case.
+"""
+import bcrypt
+import pytest
+
+from backend.tests._ctx import HASH_50A, HASH_72A, PWD_CTX
+
+
+@pytest.fixture(scope="module")
+def salt():
+    """One low-cost salt shared by the raw bcrypt cases"""
+    return bcrypt.gensalt(rounds=4)
+
+
+@pytest.mark.parametrize(
+    "password",
+    [
+        "a" * 80,  # long str, left to passlib
+        "a" * 5,   # short password
+    ],
+)
+def test_passlib_hash_verify(password):
+    """Hashing then verifying the same input must round-trip."""
+    hash_ = PWD_CTX.hash(password)
+    print(f"Hash created for length {len(password)}: {hash_}")
+
+    assert PWD_CTX.verify(password, hash_)
+
+
+@pytest.mark.parametrize(
+    "truncated_pw,hash_",
+    [
+        (b"a" * 72, HASH_72A),  # truncated to the 72 byte bcrypt limit
+        (b"a" * 50, HASH_50A),  # truncated well below the limit
+    ],
+    # The hashes are salted per process, so they must not end up in the
+    # test IDs; those have to stay the same from run to run.
+    ids=["72-bytes", "50-bytes"],
+)
+def test_passlib_verify_truncated(truncated_pw, hash_):
+    """A truncated password verifies against the precomputed hash."""
+    assert PWD_CTX.verify(truncated_pw, hash_)
+
+
+def test_raw_bcrypt_hashpw(salt):
+    """The bcrypt backend accepts a truncated bytes password directly."""
+    truncated_pw = b"a" * 50
+
+    hashed = bcrypt.hashpw(truncated_pw, salt)
+    print(f"Salt: {salt}")
+    print(f"Hash: {hashed}")
+
+    assert bcrypt.checkpw(truncated_pw, hashed)
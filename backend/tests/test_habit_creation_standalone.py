@@ -1,25 +1,22 @@
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from backend.services.planner_service import planner_service
-from datetime import datetime
+from backend.tests._ctx import CREATED_AT, CREATED_AT_ISO, _Result
 
 @pytest.mark.asyncio
 async def test_get_user_habits():
     """Test retrieving user habits."""
     mock_db = AsyncMock()
-    mock_result = MagicMock()
     
     # Mock habit data with ISO formatted dates
-    created_at = datetime.utcnow()
     mock_habit_row = (
         1, "Test Habit", "Description", 
         {"streak": 5, "frequency": "daily", "lastCompleted": "2024-01-01"}, 
-        created_at
+        CREATED_AT
     )
     
-    mock_result.fetchall.return_value = [mock_habit_row]
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = _Result([mock_habit_row])
     
     with patch("backend.services.planner_service.get_db", return_value=iter([mock_db])):
         habits = await planner_service.get_user_habits(user_id="1")
@@ -28,7 +25,7 @@ async def test_get_user_habits():
         assert habits[0]["name"] == "Test Habit"
         assert habits[0]["currentStreak"] == 0  # Streak broken test
         assert habits[0]["frequency"] == "daily"
-        assert habits[0]["createdAt"] == created_at.isoformat()
+        assert habits[0]["createdAt"] == CREATED_AT_ISO
 
 @pytest.mark.asyncio
 async def test_create_habit():
@@ -89,3 +89,35 @@ async def test_calculate_scores_missing_trait_uses_dynamic_average():
     # not a hardcoded neutral 50.
     assert scores["openness"] == 100
     assert scores["conscientiousness"] == 100
+
+
+@pytest.mark.asyncio
+async def test_calculate_scores_applies_reverse_keying():
+    service = BigFiveTestService()
+    responses = [
+        {"trait": "extraversion", "direction": 1, "response": 4},
+        {"trait": "extraversion", "direction": -1, "response": 2},
+        {"trait": "neuroticism", "direction": -1, "response": 5},
+    ]
+
+    scores = await service._calculate_scores(responses)
+
+    assert scores["extraversion"] == 75
+    assert scores["neuroticism"] == 0
+    # Missing traits use the overall average (4 + 4 + 1) / 3
+    assert scores["openness"] == 50
+
+
+def test_build_balanced_question_set_covers_every_trait():
+    questions = [
+        {"text": f"{trait} Q{i}", "trait": trait, "direction": 1, "source": "ai", "options": []}
+        for trait in ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+        for i in range(8)
+    ]
+    balanced = PersonalityTools._build_balanced_question_set(questions, num_questions=12)
+
+    assert len(balanced) == 12
+    assert len({q["text"] for q in balanced}) == 12
+    assert {q["trait"] for q in balanced} == {
+        "openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"
+    }
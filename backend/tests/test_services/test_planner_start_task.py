@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.services.planner_service import planner_service
+from backend.tests._ctx import _db_gen
+
+
+def _session(task):
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=task))
+    return session
+
+
+@pytest.mark.asyncio
+async def test_start_task_returns_none_for_missing_task():
+    session = _session(None)
+
+    with patch("backend.services.planner_service.get_db", return_value=_db_gen(session)):
+        result = await planner_service.start_task("1", "42")
+
+    assert result is None
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_start_task_counts_retries():
+    task = SimpleNamespace(status="overdue", meta={"retry_count": 1})
+    session = _session(task)
+
+    with patch("backend.services.planner_service.get_db", return_value=_db_gen(session)), \
+         patch("backend.services.planner_service.realtime_analytics.track_event", new_callable=AsyncMock), \
+         patch("sqlalchemy.orm.attributes.flag_modified"), \
+         patch.object(planner_service, "_task_to_dict", side_effect=lambda t: {"status": t.status, "meta": t.meta}):
+        result = await planner_service.start_task("1", "42")
+
+    assert result["status"] == "in-progress"
+    assert result["meta"]["retry_count"] == 2
+    assert "started_at" in result["meta"]
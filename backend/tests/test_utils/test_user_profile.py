@@ -0,0 +1,190 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from freezegun import freeze_time
+
+from backend.utils.user_profile import (
+    DEFAULT_PREFERENCES,
+    DEFAULT_SECURITY,
+    _compile_merge,
+    _deep_merge,
+    _normalize_plan_type,
+    _usage_today_key,
+    build_user_profile,
+    merge_preferences,
+    merge_usage_time,
+    set_security_settings,
+)
+
+
+def test_merge_preferences_fills_defaults():
+    merged = merge_preferences({"theme": "light"})
+
+    assert merged["theme"] == "light"
+    assert merged["language"] == "en"
+    assert merged["notifications"]["push"]["types"]["goals"] is False
+
+
+def test_merge_preferences_deep_merges_updates():
+    merged = merge_preferences(
+        {"notifications": {"email": {"frequency": "weekly"}}},
+        {"notifications": {"email": {"enabled": False}}},
+    )
+
+    email = merged["notifications"]["email"]
+    assert email["frequency"] == "weekly"
+    assert email["enabled"] is False
+    assert email["types"]["reminders"] is True
+
+
+def test_merge_preferences_results_are_independent():
+    current = {"aiBehavior": {"mode": "focused"}}
+    first = merge_preferences(current)
+    first["aiBehavior"]["context"]["memorySize"] = 99
+    first["avatar"] = "changed"
+
+    second = merge_preferences(current)
+
+    assert second["aiBehavior"]["context"]["memorySize"] == 10
+    assert "avatar" not in second
+    assert DEFAULT_PREFERENCES["aiBehavior"]["context"]["memorySize"] == 10
+
+
+def test_merge_preferences_keeps_security_block():
+    merged = merge_preferences({"security": {"twoFactorEnabled": True}})
+
+    assert merged["security"]["twoFactorEnabled"] is True
+    assert merged["security"]["sessionManagement"]["maxSessions"] == 5
+
+
+def test_deep_merge_does_not_alias_base():
+    base = {"a": {"b": [1, 2]}, "c": {"d": 1}}
+    merged = _deep_merge(base, {"c": {"e": 2}, "f": 3})
+
+    assert merged == {"a": {"b": [1, 2]}, "c": {"d": 1, "e": 2}, "f": 3}
+    merged["a"]["b"].append(3)
+    merged["c"]["d"] = 5
+    assert base == {"a": {"b": [1, 2]}, "c": {"d": 1}}
+
+
+@pytest.mark.parametrize(
+    "template, overrides",
+    [
+        (DEFAULT_PREFERENCES, {}),
+        (
+            DEFAULT_PREFERENCES,
+            {
+                "extra": {"x": 1},
+                "theme": "light",
+                "notifications": {"push": None, "email": {"types": {"new": True}}},
+            },
+        ),
+        (DEFAULT_SECURITY, {"trustedDevices": ["laptop"], "sessionManagement": {"maxSessions": 1}}),
+    ],
+)
+def test_compile_merge_matches_deep_merge(template, overrides):
+    merged = _compile_merge(template)(overrides)
+    expected = _deep_merge(template, overrides)
+
+    assert merged == expected
+    assert json.dumps(merged) == json.dumps(expected)
+
+
+def test_compile_merge_does_not_alias_template():
+    merged = _compile_merge(DEFAULT_SECURITY)({})
+    merged["trustedDevices"].append("phone")
+    merged["sessionManagement"]["maxSessions"] = 1
+
+    assert DEFAULT_SECURITY["trustedDevices"] == []
+    assert DEFAULT_SECURITY["sessionManagement"]["maxSessions"] == 5
+
+
+def test_normalize_plan_type_maps_legacy_names():
+    assert _normalize_plan_type(None) == "EXPLORER"
+    assert _normalize_plan_type("pro") == "ULTRA"
+    assert _normalize_plan_type("Enterprise") == "ULTRA"
+    assert _normalize_plan_type("unknown") == "EXPLORER"
+
+
+def test_usage_today_key_falls_back_to_utc():
+    utc_key = _usage_today_key("UTC")
+
+    assert _usage_today_key(None) == utc_key
+    assert _usage_today_key("Not/AZone") == utc_key
+    assert _usage_today_key(["UTC"]) == utc_key
+
+
+def test_usage_today_key_rolls_over_at_local_midnight():
+    with freeze_time("2024-03-09 23:59:00+09:00") as frozen:
+        assert _usage_today_key("Asia/Tokyo") == "2024-03-09"
+        frozen.tick(59)
+        assert _usage_today_key("Asia/Tokyo") == "2024-03-09"
+        frozen.tick(1)
+        assert _usage_today_key("Asia/Tokyo") == "2024-03-10"
+        assert _usage_today_key("UTC") == "2024-03-09"
+
+    with freeze_time("2023-12-31 12:00:00"):
+        assert _usage_today_key("Asia/Tokyo") == "2023-12-31"
+
+
+def test_set_security_settings_leaves_input_untouched():
+    prefs = merge_preferences({})
+    updated = set_security_settings(prefs, {"loginAlerts": True})
+
+    assert updated["security"]["loginAlerts"] is True
+    assert updated["security"]["sessionManagement"]["autoLogout"] == 1440
+    assert "security" not in prefs
+
+
+def test_merge_usage_time_prefers_same_day_maximum():
+    merged = merge_usage_time(
+        {"date": "2024-06-01", "minutes": "30", "totalMinutes": 100, "updatedAt": "a"},
+        {"date": "2024-06-01", "minutes": 20, "totalMinutes": True},
+    )
+
+    assert merged == {"date": "2024-06-01", "minutes": 30, "totalMinutes": 100, "updatedAt": "a"}
+    assert type(merged["minutes"]) is int
+
+
+def _user(**overrides):
+    fields = {
+        "id": 7,
+        "email": "ada@example.com",
+        "full_name": None,
+        "plan_type": "pro",
+        "tier": "pro",
+        "role": "user",
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "updated_at": None,
+        "is_verified": True,
+        "is_active": True,
+        "preferences": {"usageTime": {"date": "2000-01-01", "minutes": 5, "totalMinutes": 42}},
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_build_user_profile_fills_stats():
+    profile = build_user_profile(_user())
+
+    assert profile["name"] == "ada"
+    assert profile["planType"] == "ULTRA"
+    assert profile["stats"] == {
+        "totalSessions": 0,
+        "totalTokens": 0,
+        "avgRating": 0,
+        "joinedAt": "2024-01-01T00:00:00+00:00",
+        "lastActiveAt": "2024-01-01T00:00:00+00:00",
+        "timeSpentToday": 0,
+        "totalTimeSpent": 42,
+        "lastActivityAt": "2024-01-01T00:00:00+00:00",
+    }
+
+
+def test_build_user_profile_stats_are_not_shared():
+    first = build_user_profile(_user())
+    first["stats"]["totalSessions"] = 3
+
+    assert build_user_profile(_user(id=8))["stats"]["totalSessions"] == 0
@@ -0,0 +1,11 @@
+"""
+asyncio entry point shared by the command-line scripts.
+"""
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None
+
+run = uvloop.run if uvloop else asyncio.run
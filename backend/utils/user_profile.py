@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Dict
 from zoneinfo import ZoneInfo
 
 from backend.db.models import User
@@ -49,6 +50,9 @@ DEFAULT_SECURITY: Dict[str, Any] = {
 }
 
 def _coerce_int(value: Any, default: int = 0) -> int:
+    # Exact type check so bools still go through int()
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -56,21 +60,44 @@ def _coerce_int(value: Any, default: int = 0) -> int:
 
 
 def _safe_iso_date(value: Any) -> str | None:
-    if value is None:
-        return None
+    if value is None or type(value) is str:
+        return value
     try:
         return str(value)
     except Exception:
         return None
 
 
-def _usage_today_key(timezone_name: str | None) -> str:
-    tz_name = timezone_name or "UTC"
+@lru_cache(maxsize=128)
+def _get_zone(tz_name: str) -> tzinfo:
     try:
-        tz = ZoneInfo(tz_name)
+        return ZoneInfo(tz_name)
     except Exception:
-        tz = timezone.utc
-    return datetime.now(tz).date().isoformat()
+        return timezone.utc
+
+
+# tz name -> (day key, epoch seconds the key is valid from, and until)
+_TODAY_KEYS: Dict[str, tuple[str, float, float]] = {}
+
+
+def _usage_today_key(timezone_name: str | None) -> str:
+    tz_name = timezone_name if timezone_name and isinstance(timezone_name, str) else "UTC"
+    now = time.time()
+    cached = _TODAY_KEYS.get(tz_name)
+    if cached is not None and cached[1] <= now < cached[2]:
+        return cached[0]
+
+    tz = _get_zone(tz_name)
+    today = datetime.fromtimestamp(now, tz).date()
+    midnight = datetime(today.year, today.month, today.day, tzinfo=tz)
+    start = min(midnight.timestamp(), now)
+    # Re-check at least hourly in case a DST shift lands on midnight
+    end = min((midnight + timedelta(days=1)).timestamp(), now + 3600)
+    key = today.isoformat()
+    if len(_TODAY_KEYS) >= 256:
+        _TODAY_KEYS.clear()
+    _TODAY_KEYS[tz_name] = (key, start, end)
+    return key
 
 
 def merge_usage_time(existing: Dict[str, Any] | None, incoming: Dict[str, Any] | None) -> Dict[str, Any]:
@@ -104,59 +131,129 @@ def merge_usage_time(existing: Dict[str, Any] | None, incoming: Dict[str, Any] |
     }
 
 
+def _copy_json(value: Any) -> Any:
+    """Copy the dict/list containers of JSON-like data, sharing immutable leaves."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
 def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    result = deepcopy(base)
-    for key, value in (overrides or {}).items():
-        if isinstance(value, dict) and isinstance(result.get(key), dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Base branches are copied exactly once: overridden dicts are rebuilt as
+    # new stack frames, untouched ones by _copy_json. Callers mutate the
+    # result, so nothing from base may be shared by reference.
+    result: Dict[str, Any] = {}
+    stack = [(result, base, overrides or {})]
+    while stack:
+        dst, src, over = stack.pop()
+        for key, value in src.items():
+            if key not in over:
+                dst[key] = _copy_json(value)
+                continue
+            override = over[key]
+            if isinstance(override, dict) and isinstance(value, dict):
+                # Insert now so key order matches base; filled when popped
+                child: Dict[str, Any] = {}
+                dst[key] = child
+                stack.append((child, value, override))
+            else:
+                dst[key] = override
+        for key, value in over.items():
+            if key not in src:
+                dst[key] = value
     return result
 
 
+_MISSING = object()
+
+
+def _compile_merge(template: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Specialise _deep_merge(template, overrides) on template's fixed shape.
+
+    Which keys hold nested dicts or lists is resolved once here, so the
+    returned merge copies leaves in C via dict.copy()/update() and only
+    visits the known branches. Result and key order match _deep_merge.
+    """
+    branches = tuple(
+        (key, _compile_merge(value)) for key, value in template.items() if isinstance(value, dict)
+    )
+    lists = tuple((key, value) for key, value in template.items() if isinstance(value, list))
+
+    def merge(overrides: Dict[str, Any]) -> Dict[str, Any]:
+        result = template.copy()
+        result.update(overrides)
+        for key, merge_branch in branches:
+            override = overrides.get(key, _MISSING)
+            if override is _MISSING:
+                result[key] = merge_branch({})
+            elif isinstance(override, dict):
+                result[key] = merge_branch(override)
+        for key, value in lists:
+            if key not in overrides:
+                result[key] = _copy_json(value)
+        return result
+
+    return merge
+
+
+_merge_default_preferences = _compile_merge(DEFAULT_PREFERENCES)
+_merge_default_security = _compile_merge(DEFAULT_SECURITY)
+
+
 def merge_preferences(current: Dict[str, Any] | None, updates: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    merged = _deep_merge(DEFAULT_PREFERENCES, current or {})
+    merged = _merge_default_preferences(current or {})
     if updates:
         merged = _deep_merge(merged, updates)
     if "security" in (current or {}):
-        merged["security"] = _deep_merge(DEFAULT_SECURITY, (current or {}).get("security", {}))
+        merged["security"] = _merge_default_security((current or {}).get("security") or {})
     return merged
 
 
 def get_security_settings(prefs: Dict[str, Any]) -> Dict[str, Any]:
     security = prefs.get("security") if isinstance(prefs, dict) else None
-    return _deep_merge(DEFAULT_SECURITY, security or {})
+    return _merge_default_security(security or {})
 
 
 def set_security_settings(prefs: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
-    prefs = deepcopy(prefs or {})
+    # Shallow copy: only "security" is replaced, every other branch is shared
+    # with the caller's prefs and must not be mutated through the result.
+    prefs = dict(prefs or {})
     prefs["security"] = _deep_merge(get_security_settings(prefs), updates or {})
     return prefs
 
 
+_PLAN_MAP: Dict[str, str] = {
+    "BASIC": "EXPLORER",
+    "EXPLORER": "EXPLORER",
+    "PRO": "ULTRA",
+    "ULTRA": "ULTRA",
+    "ENTERPRISE": "ULTRA",
+}
+
+_FULL_TIERS = frozenset({"elite", "pro", "enterprise"})
+_FULL_FEATURES: tuple[str, ...] = ("all-features",)
+_BASIC_FEATURES: tuple[str, ...] = ("basic-chat", "basic-analytics")
+
+
 def _normalize_plan_type(plan_type: str | None) -> str:
-    plan_raw = (plan_type or "BASIC").upper()
-    plan_map = {
-        "BASIC": "EXPLORER",
-        "EXPLORER": "EXPLORER",
-        "PRO": "ULTRA",
-        "ULTRA": "ULTRA",
-        "ENTERPRISE": "ULTRA",
-    }
-    return plan_map.get(plan_raw, "EXPLORER")
+    return _PLAN_MAP.get((plan_type or "BASIC").upper(), "EXPLORER")
 
 
-def _subscription_features(tier: str, role: str) -> list[str]:
-    if role == "admin" or tier in {"elite", "pro", "enterprise"}:
-        return ["all-features"]
-    return ["basic-chat", "basic-analytics"]
+def _subscription_features(tier: str, role: str) -> tuple[str, ...]:
+    if role == "admin" or tier in _FULL_TIERS:
+        return _FULL_FEATURES
+    return _BASIC_FEATURES
 
 
 def build_user_profile(user: User) -> Dict[str, Any]:
     prefs = merge_preferences(user.preferences or {})
     security = get_security_settings(prefs)
-    usage_time = prefs.get("usageTime") if isinstance(prefs, dict) else None
-    usage_time = usage_time if isinstance(usage_time, dict) else {}
+    usage_time = prefs.get("usageTime")
+    if not isinstance(usage_time, dict):
+        usage_time = {}
+    timezone_name = prefs.get("timezone", "UTC")
 
     name = user.full_name or (user.email.split("@")[0] if user.email else "")
     plan_type = _normalize_plan_type(user.plan_type)
@@ -166,7 +263,7 @@ def build_user_profile(user: User) -> Dict[str, Any]:
 
     created_at = user.created_at or datetime.now(timezone.utc)
     updated_at = user.updated_at or created_at
-    today_key = _usage_today_key(prefs.get("timezone", "UTC") if isinstance(prefs, dict) else "UTC")
+    today_key = _usage_today_key(timezone_name)
     usage_date = _safe_iso_date(usage_time.get("date"))
     time_spent_today = _coerce_int(usage_time.get("minutes"), 0) if usage_date == today_key else 0
     total_time_spent = _coerce_int(usage_time.get("totalMinutes"), 0)
@@ -198,7 +295,7 @@ def build_user_profile(user: User) -> Dict[str, Any]:
             "emailVerified": bool(user.is_verified),
             "twoFactorEnabled": bool(security.get("twoFactorEnabled")),
             "accountStatus": "active" if user.is_active else "suspended",
-            "timezone": prefs.get("timezone", "UTC"),
+            "timezone": timezone_name,
             "language": prefs.get("language", "en"),
         },
         "preferences": prefs,
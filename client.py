@@ -6,10 +6,48 @@ Optileno AI Client - Test and interact with the AI assistant
 import asyncio
 import aiohttp
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 import argparse
 import sys
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_pretty(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a JSON body straight from its bytes, without the str decode
+    response.json() does first; worth it for large analytics payloads."""
+    buf = bytearray()
+    async for chunk, _ in response.content.iter_chunks():
+        buf += chunk
+    return _json_loads(buf)
+
+
 class OptilenoClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
@@ -17,7 +55,15 @@ class OptilenoClient:
         self.access_token: Optional[str] = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Keep connections to the API alive and reuse resolved addresses so
+        # batch mode does not pay a TCP/DNS round trip per message.
+        connector = aiohttp.TCPConnector(
+            limit=256,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -35,7 +81,7 @@ class OptilenoClient:
                 json={"username": email, "password": password}
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
                     self.access_token = data.get("access_token")
                     return True
                 else:
@@ -66,7 +112,7 @@ class OptilenoClient:
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=_json_loads)
                 else:
                     error_text = await response.text()
                     print(f"Error sending message: {response.status} - {error_text}")
@@ -91,7 +137,7 @@ class OptilenoClient:
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await _read_json(response)
                 else:
                     error_text = await response.text()
                     print(f"Error getting analytics: {response.status} - {error_text}")
@@ -100,6 +146,34 @@ class OptilenoClient:
             print(f"Error getting analytics: {e}")
             return {"error": str(e)}
 
+def print_response(response: Dict[str, Any]) -> None:
+    """Print an AI reply along with any actions and pending confirmations"""
+    print(f"🤖 Leno: {response.get('message', 'No response')}")
+    
+    # Show any actions
+    actions = response.get('actions', [])
+    if actions:
+        print(f"🔧 Actions taken: {len(actions)}")
+        for action in actions:
+            print(f"   - {action}")
+    
+    # Show any pending confirmations
+    confirmations = response.get('pending_confirmations', [])
+    if confirmations:
+        print(f"❓ Pending confirmations: {len(confirmations)}")
+        for conf in confirmations:
+            print(f"   - {conf.get('message', 'Confirmation needed')}")
+
+async def send_batch(client: OptilenoClient, messages: List[str], concurrency: int) -> List[Dict[str, Any]]:
+    """Send messages concurrently, keeping at most `concurrency` requests in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(message: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await client.send_message(message)
+
+    return await asyncio.gather(*(send(message) for message in messages))
+
 async def main():
     parser = argparse.ArgumentParser(description="Optileno AI Client")
     parser.add_argument("--email", required=True, help="User email")
@@ -107,6 +181,8 @@ async def main():
     parser.add_argument("--server", default="http://localhost:8000", help="Server URL")
     parser.add_argument("--interactive", action="store_true", help="Interactive mode")
     parser.add_argument("--message", help="Send a single message")
+    parser.add_argument("--batch-file", help="Send every non-empty line of a file as a message")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max in-flight requests in batch mode")
     
     args = parser.parse_args()
 
@@ -125,25 +201,11 @@ async def main():
                         elif user_input.lower() == 'analytics':
                             print("Fetching analytics...")
                             analytics = await client.get_analytics()
-                            print(f"📊 Analytics: {json.dumps(analytics, indent=2)}")
+                            print(f"📊 Analytics: {_json_pretty(analytics)}")
                         elif user_input:
                             print("Sending message...")
                             response = await client.send_message(user_input)
-                            print(f"🤖 Leno: {response.get('message', 'No response')}")
-                            
-                            # Show any actions
-                            actions = response.get('actions', [])
-                            if actions:
-                                print(f"🔧 Actions taken: {len(actions)}")
-                                for action in actions:
-                                    print(f"   - {action}")
-                            
-                            # Show any pending confirmations
-                            confirmations = response.get('pending_confirmations', [])
-                            if confirmations:
-                                print(f"❓ Pending confirmations: {len(confirmations)}")
-                                for conf in confirmations:
-                                    print(f"   - {conf.get('message', 'Confirmation needed')}")
+                            print_response(response)
                     except KeyboardInterrupt:
                         break
                     except EOFError:
@@ -151,26 +213,21 @@ async def main():
             elif args.message:
                 print(f"Sending message: {args.message}")
                 response = await client.send_message(args.message)
-                print(f"🤖 Leno: {response.get('message', 'No response')}")
-                
-                # Show any actions
-                actions = response.get('actions', [])
-                if actions:
-                    print(f"🔧 Actions taken: {len(actions)}")
-                    for action in actions:
-                        print(f"   - {action}")
-                
-                # Show any pending confirmations
-                confirmations = response.get('pending_confirmations', [])
-                if confirmations:
-                    print(f"❓ Pending confirmations: {len(confirmations)}")
-                    for conf in confirmations:
-                        print(f"   - {conf.get('message', 'Confirmation needed')}")
+                print_response(response)
+            elif args.batch_file:
+                with open(args.batch_file, encoding="utf-8") as f:
+                    messages = [line.strip() for line in f if line.strip()]
+                print(f"Sending {len(messages)} messages (concurrency {args.concurrency})...")
+                responses = await send_batch(client, messages, max(1, args.concurrency))
+                for message, response in zip(messages, responses):
+                    print(f"\nYou: {message}")
+                    print_response(response)
             else:
-                print("Use --interactive to start interactive mode or --message to send a single message")
+                print("Use --interactive to start interactive mode, --message to send a single message or --batch-file to send a file of messages")
         else:
             print("❌ Login failed")
             sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run = uvloop.run if uvloop else asyncio.run
+    run(main())
\ No newline at end of file
@@ -1,23 +1,32 @@
+"""
+Fetch a behavior timeline for user 1 and print it.
 
+Backend modules are imported inside test_timeline() so the script reports
+progress straight away; for a per-module breakdown of a slow import, run:
+    python -X importtime debug_behavior_timeline.py 2> importtime.log
+"""
 print("Starting debug script...")
 import sys
 import os
-import asyncio
+import time
 
 # Add the project root to sys.path
 sys.path.append(os.getcwd())
 
-try:
-    print("Importing get_db...")
-    from backend.db.database import get_db
-    print("Importing service...")
-    from backend.services.behavior_timeline_service import behavior_timeline_service
-    print("Imports successful.")
-except Exception as e:
-    print(f"Import Error: {e}")
-    sys.exit(1)
-
 async def test_timeline():
+    try:
+        started = time.perf_counter()
+        print("Importing get_db...")
+        from backend.db.database import get_db
+        print(f"Imported get_db in {time.perf_counter() - started:.2f}s")
+        started = time.perf_counter()
+        print("Importing service...")
+        from backend.services.behavior_timeline_service import behavior_timeline_service
+        print(f"Imported service in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        print(f"Import Error: {e}")
+        sys.exit(1)
+
     print("Running timeline test...")
     try:
         user_id = 1
@@ -29,6 +38,5 @@ async def test_timeline():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(test_timeline())
+    from backend.utils.event_loop import run
+    run(test_timeline())
@@ -1,13 +1,21 @@
+"""
+Check that the FastAPI app imports cleanly and report how long it took.
+
+For a per-module breakdown of a slow import, run:
+    python -X importtime debug_startup.py 2> importtime.log
+"""
 import sys
 import os
+import time
 
 # Add the project root to sys.path
 sys.path.append(os.getcwd())
 
 try:
     print("Attempting to import backend.app.main...")
+    started = time.perf_counter()
     from backend.app.main import app
-    print("Successfully imported backend.app.main")
+    print(f"Successfully imported backend.app.main in {time.perf_counter() - started:.2f}s")
 except Exception as e:
     print(f"Failed to import backend.app.main: {e}")
     import traceback
@@ -3,7 +3,6 @@
 Test script to verify AI agent functionality for creating goals, tasks, and habits.
 """
 
-import asyncio
 import json
 from datetime import datetime
 
@@ -11,6 +10,7 @@ from datetime import datetime
 from backend.ai.client import DualAIClient
 from backend.services.planner_service import planner_service
 from backend.services.analytics_service import analytics_service
+from backend.utils.event_loop import run
 
 async def test_ai_agent():
     print("🧪 Testing AI Agent Functionality")
@@ -91,4 +91,4 @@ async def test_ai_agent():
     print("=" * 50)
 
 if __name__ == "__main__":
-    asyncio.run(test_ai_agent())
\ No newline at end of file
+    run(test_ai_agent())
\ No newline at end of file
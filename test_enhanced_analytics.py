@@ -3,125 +3,116 @@ Test script to validate the enhanced analytics components
 """
 
 import asyncio
+import io
+import traceback
+from itertools import islice
 import sys
 import os
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
 from backend.services.enhanced_ai_intelligence_service import enhanced_ai_intelligence_service
 from backend.services.enhanced_goal_analytics_service import enhanced_goal_analytics_service
-from backend.db.session import get_db
+from backend.db.session import get_db_context
 from backend.db.models import User, Goal, Task
+from backend.utils.event_loop import run
 from sqlalchemy import select
 
 
-async def test_enhanced_ai_intelligence():
+async def test_enhanced_ai_intelligence(user):
     """Test the enhanced AI intelligence service"""
-    print("Testing Enhanced AI Intelligence Service...")
+    # Buffered and written once, so concurrent tests do not interleave
+    out = io.StringIO()
+    try:
+        print("Testing Enhanced AI Intelligence Service...", file=out)
+    
+        print(f"Testing with user: {user.email}", file=out)
     
-    # Get a test user
-    async for db in get_db():
-        user_result = await db.execute(select(User).limit(1))
-        user = user_result.scalar_one_or_none()
-        
-        if not user:
-            print("No users found in database, skipping test")
-            return
-            
-        print(f"Testing with user: {user.email}")
-        
         # Test daily score
         daily_score = await enhanced_ai_intelligence_service.get_score(user.id, 'daily')
-        print(f"Daily Score: {daily_score['score']}")
-        print(f"Category: {daily_score['category']}")
-        print(f"Metrics: {daily_score['metrics']}")
-        
+        print(f"Daily Score: {daily_score['score']}", file=out)
+        print(f"Category: {daily_score['category']}", file=out)
+        print(f"Metrics: {daily_score['metrics']}", file=out)
+    
         # Test weekly score
         weekly_score = await enhanced_ai_intelligence_service.get_score(user.id, 'weekly')
-        print(f"Weekly Score: {weekly_score['score']}")
-        print(f"Weekly Category: {weekly_score['category']}")
-        print(f"Weekly Trend: {weekly_score.get('trend', 'N/A')}")
-        
+        print(f"Weekly Score: {weekly_score['score']}", file=out)
+        print(f"Weekly Category: {weekly_score['category']}", file=out)
+        print(f"Weekly Trend: {weekly_score.get('trend', 'N/A')}", file=out)
+    
         # Test monthly score
         monthly_score = await enhanced_ai_intelligence_service.get_score(user.id, 'monthly')
-        print(f"Monthly Score: {monthly_score['score']}")
-        print(f"Monthly Category: {monthly_score['category']}")
-        print(f"Monthly Volatility: {monthly_score.get('volatility', 'N/A')}")
-        
-        print("+ Enhanced AI Intelligence Service test completed\n")
+        print(f"Monthly Score: {monthly_score['score']}", file=out)
+        print(f"Monthly Category: {monthly_score['category']}", file=out)
+        print(f"Monthly Volatility: {monthly_score.get('volatility', 'N/A')}", file=out)
+    
+        print("+ Enhanced AI Intelligence Service test completed\n", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
-async def test_enhanced_goal_analytics():
+async def test_enhanced_goal_analytics(user):
     """Test the enhanced goal analytics service"""
-    print("Testing Enhanced Goal Analytics Service...")
+    # Buffered and written once, so concurrent tests do not interleave
+    out = io.StringIO()
+    try:
+        print("Testing Enhanced Goal Analytics Service...", file=out)
+    
+        print(f"Testing with user: {user.email}", file=out)
     
-    # Get a test user
-    async for db in get_db():
-        user_result = await db.execute(select(User).limit(1))
-        user = user_result.scalar_one_or_none()
-        
-        if not user:
-            print("No users found in database, skipping test")
-            return
-            
-        print(f"Testing with user: {user.email}")
-        
         # Test goal progress report
         try:
             goal_report = await enhanced_goal_analytics_service.get_goal_progress_report(str(user.id))
-            print(f"Overall Progress: {goal_report['overall_progress']}")
-            print(f"Total Goals: {goal_report['total_goals']}")
-            print(f"On Track: {goal_report['on_track_count']}")
-            print(f"At Risk: {goal_report['at_risk_count']}")
-            
+            print(f"Overall Progress: {goal_report['overall_progress']}", file=out)
+            print(f"Total Goals: {goal_report['total_goals']}", file=out)
+            print(f"On Track: {goal_report['on_track_count']}", file=out)
+            print(f"At Risk: {goal_report['at_risk_count']}", file=out)
+        
             # Print details for each goal if available
-            for goal in goal_report.get('goals', [])[:2]:  # Show first 2 goals
-                print(f"  Goal: {goal.get('title', 'N/A')}")
-                print(f"    Progress: {goal.get('progress', 0)}%")
-                print(f"    Status: {goal.get('status', 'N/A')}")
-                print(f"    Velocity: {goal.get('velocity', 0)}")
-                print(f"    Trend: {goal.get('trend', 'N/A')}")
+            for goal in islice(goal_report.get('goals') or (), 2):  # Show first 2 goals
+                print(f"  Goal: {goal.get('title', 'N/A')}", file=out)
+                print(f"    Progress: {goal.get('progress', 0)}%", file=out)
+                print(f"    Status: {goal.get('status', 'N/A')}", file=out)
+                print(f"    Velocity: {goal.get('velocity', 0)}", file=out)
+                print(f"    Trend: {goal.get('trend', 'N/A')}", file=out)
                 tasks = goal.get('tasks', {})
-                print(f"    Tasks: {tasks.get('completed', 0)}/{tasks.get('total', 0)}")
+                print(f"    Tasks: {tasks.get('completed', 0)}/{tasks.get('total', 0)}", file=out)
         except KeyError as e:
-            print(f"No goals found for user: {e}")
-            print("Testing with user that has no goals...")
+            print(f"No goals found for user: {e}", file=out)
+            print("Testing with user that has no goals...", file=out)
             # Just test with the user that has no goals
             goal_report = await enhanced_goal_analytics_service.get_goal_progress_report(str(user.id))
-            print(f"Overall Progress: {goal_report.get('overall_progress', 0)}")
-            print(f"Total Goals: {goal_report.get('total_goals', 0)}")
-            print(f"On Track: {goal_report.get('on_track_count', 0)}")
-            print(f"At Risk: {goal_report.get('at_risk_count', 0)}")
-        
+            print(f"Overall Progress: {goal_report.get('overall_progress', 0)}", file=out)
+            print(f"Total Goals: {goal_report.get('total_goals', 0)}", file=out)
+            print(f"On Track: {goal_report.get('on_track_count', 0)}", file=out)
+            print(f"At Risk: {goal_report.get('at_risk_count', 0)}", file=out)
+    
         # Test daily achievement score
         daily_score = await enhanced_goal_analytics_service.get_daily_achievement_score(str(user.id))
-        print(f"Daily Achievement Score: {daily_score.get('daily_score', 0)}")
-        print(f"Grade: {daily_score.get('grade', 'N/A')}")
-        print(f"Breakdown: {daily_score.get('breakdown', {})}")
-        
+        print(f"Daily Achievement Score: {daily_score.get('daily_score', 0)}", file=out)
+        print(f"Grade: {daily_score.get('grade', 'N/A')}", file=out)
+        print(f"Breakdown: {daily_score.get('breakdown', {})}", file=out)
+    
         # Test goal timeline
         timeline = await enhanced_goal_analytics_service.get_goal_timeline(str(user.id))
-        print(f"Timeline Events: {len(timeline)}")
-        for event in timeline[:5]:  # Show first 5 events
-            print(f"  Event: {event.get('type', 'N/A')} - {event.get('title', 'N/A')} on {event.get('date', 'N/A')}")
-        
-        print("+ Enhanced Goal Analytics Service test completed\n")
+        print(f"Timeline Events: {len(timeline)}", file=out)
+        for event in islice(timeline, 5):  # Show first 5 events
+            print(f"  Event: {event.get('type', 'N/A')} - {event.get('title', 'N/A')} on {event.get('date', 'N/A')}", file=out)
+    
+        print("+ Enhanced Goal Analytics Service test completed\n", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
-async def test_realtime_updates():
+async def test_realtime_updates(db, user):
     """Test real-time update functionality"""
-    print("Testing Real-time Updates...")
+    # Buffered and written once, so concurrent tests do not interleave
+    out = io.StringIO()
+    try:
+        print("Testing Real-time Updates...", file=out)
+    
+        print(f"Testing real-time updates with user: {user.email}", file=out)
     
-    # Get a test user
-    async for db in get_db():
-        user_result = await db.execute(select(User).limit(1))
-        user = user_result.scalar_one_or_none()
-        
-        if not user:
-            print("No users found in database, skipping test")
-            return
-            
-        print(f"Testing real-time updates with user: {user.email}")
-        
         # Simulate an event that would trigger real-time updates
         event_data = {
             "event_type": "task_completed",
@@ -131,49 +122,78 @@ async def test_realtime_updates():
                 "goal_id": 1
             }
         }
-        
-        # Update AI intelligence score in real-time
-        await enhanced_ai_intelligence_service.update_score_realtime(user.id, event_data)
-        print("+ AI Intelligence score updated in real-time")
-        
-        # Update goal progress in real-time (if there are goals)
-        goals_result = await db.execute(select(Goal).where(Goal.user_id == user.id).limit(1))
-        goal = goals_result.scalar_one_or_none()
-        
-        if goal:
-            await enhanced_goal_analytics_service.update_goal_progress_realtime(
-                str(user.id), goal.id, "task_completed", {"task_id": 1}
-            )
-            print("+ Goal progress updated in real-time")
+    
+        goals_result = await db.execute(select(Goal.id).where(Goal.user_id == user.id).limit(1))
+        goal_id = goals_result.scalar_one_or_none()
+        updates = [enhanced_ai_intelligence_service.update_score_realtime(user.id, event_data)]
+        if goal_id is not None:
+            updates.append(enhanced_goal_analytics_service.update_goal_progress_realtime(
+                str(user.id), goal_id, "task_completed", {"task_id": 1}
+            ))
+        # The two updates use separate sessions, so run them side by side
+        await asyncio.gather(*updates)
+    
+        print("+ AI Intelligence score updated in real-time", file=out)
+        if goal_id is not None:
+            print("+ Goal progress updated in real-time", file=out)
         else:
-            print("- No goals found for real-time update test")
-        
-        print("+ Real-time Updates test completed\n")
+            print("- No goals found for real-time update test", file=out)
+    
+        print("+ Real-time Updates test completed\n", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
 async def run_all_tests():
     """Run all tests"""
     print("Starting Enhanced Analytics Components Tests...\n")
     
-    try:
-        await test_enhanced_ai_intelligence()
-        await test_enhanced_goal_analytics()
-        await test_realtime_updates()
-        
-        print(":) All tests completed successfully!")
-        print("\nSummary of enhancements:")
-        print("- Real-time AI intelligence scoring based on user behavior")
-        print("- Real-time goal progress tracking with accurate timeline dates")
-        print("- Enhanced metrics with 5 dimensions instead of 4")
-        print("- Real-time updates triggered by user actions")
-        print("- Accurate timeline with preserved original dates")
-        print("- Improved progress calculations based on actual behavior")
-        
-    except Exception as e:
-        print(f"X Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Look the test user up once and share it with every test
+    async with get_db_context() as db:
+        # Only id and email are read, so skip building a full User entity
+        user = (await db.execute(select(User.id, User.email).limit(1))).first()
+
+        if not user:
+            print("No users found in database, skipping tests")
+            return
+
+        # The services open their own sessions, so the two report reads'
+        # DB round trips overlap. test_realtime_updates writes the score and
+        # goal progress those reports read, so it runs only once both have
+        # finished. return_exceptions keeps one failure from cancelling the
+        # other.
+        tests = (test_enhanced_ai_intelligence, test_enhanced_goal_analytics, test_realtime_updates)
+        results = await asyncio.gather(
+            test_enhanced_ai_intelligence(user),
+            test_enhanced_goal_analytics(user),
+            return_exceptions=True,
+        )
+        try:
+            results.append(await test_realtime_updates(db, user))
+        except Exception as e:
+            results.append(e)
+
+    failed = False
+    for test, result in zip(tests, results):
+        if isinstance(result, BaseException):
+            failed = True
+            print(f"X {test.__name__} failed with error: {result}")
+            traceback.print_exception(type(result), result, result.__traceback__)
+    if failed:
+        return
+
+    print(":) All tests completed successfully!")
+    print("\nSummary of enhancements:")
+    print("- Real-time AI intelligence scoring based on user behavior")
+    print("- Real-time goal progress tracking with accurate timeline dates")
+    print("- Enhanced metrics with 5 dimensions instead of 4")
+    print("- Real-time updates triggered by user actions")
+    print("- Accurate timeline with preserved original dates")
+    print("- Improved progress calculations based on actual behavior")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_all_tests())
\ No newline at end of file
+    # Timings are only meaningful with the C Task; debuggers may swap it out
+    if asyncio.Task.__module__ != "_asyncio":
+        print(f"! asyncio.Task is the pure-Python implementation ({asyncio.Task.__module__})", file=sys.stderr)
+    run(run_all_tests())
\ No newline at end of file
@@ -1,54 +1,79 @@
 
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_JSON_START = re.compile(r'[{\[]')
+_STRUCTURAL = re.compile(r'[{}\[\]"\']')
 
 def remove_json_structures(text):
-    output = []
+    if '{' not in text and '[' not in text:
+        return text
+
+    # Kept text is collected as slices between removed blocks, not per char
+    spans = []
+    last_kept = 0
     i = 0
     n = len(text)
     
     while i < n:
-        char = text[i]
+        # Jump to the next candidate block instead of stepping through the
+        # plain text before it one character at a time.
+        match = _JSON_START.search(text, i)
+        if match is None:
+            break
+        i = match.start()
         
-        if char in ('{', '['):
-            stack = [char]
-            j = i + 1
-            is_in_string = False
-            string_char = None
-            
-            while j < n and stack:
-                c = text[j]
-                if c in ('"', "'") and (j == 0 or text[j-1] != '\\'):
-                    if not is_in_string:
-                        is_in_string = True
-                        string_char = c
-                    elif c == string_char:
-                        is_in_string = False
-                        string_char = None
-                
+        stack = [text[i]]
+        j = i + 1
+        is_in_string = False
+        string_char = None
+        
+        while j < n and stack:
+            # Only brackets and quotes change state, and inside a string only
+            # its closing quote does, so skip everything else in C.
+            if is_in_string:
+                j = text.find(string_char, j)
+            else:
+                match = _STRUCTURAL.search(text, j)
+                j = match.start() if match else -1
+            if j == -1:
+                j = n
+                break
+            c = text[j]
+            if c in ('"', "'") and (j == 0 or text[j-1] != '\\'):
                 if not is_in_string:
-                    if c == '{' or c == '[':
-                        stack.append(c)
-                    elif c == '}' or c == ']':
-                        if not stack: break
-                        last = stack[-1]
-                        if (c == '}' and last == '{') or (c == ']' and last == '['):
-                            stack.pop()
-                        else:
-                            break
-                j += 1
+                    is_in_string = True
+                    string_char = c
+                elif c == string_char:
+                    is_in_string = False
+                    string_char = None
             
-            if not stack:
-                block = text[i:j]
-                # Heuristic
-                if '"' in block and ':' in block:
-                     # It has quotes and colons, likely JSON.
-                     i = j
-                     continue
+            if not is_in_string:
+                if c == '{' or c == '[':
+                    stack.append(c)
+                elif c == '}' or c == ']':
+                    if not stack: break
+                    last = stack[-1]
+                    if (c == '}' and last == '{') or (c == ']' and last == '['):
+                        stack.pop()
+                    else:
+                        break
+            j += 1
+        
+        if not stack:
+            # Heuristic, searched in place rather than on a copied slice
+            if text.find('"', i, j) != -1 and text.find(':', i, j) != -1:
+                 # It has quotes and colons, likely JSON.
+                 spans.append(text[last_kept:i])
+                 i = last_kept = j
+                 continue
         
-        output.append(char)
         i += 1
     
-    return "".join(output)
+    spans.append(text[last_kept:])
+    return "".join(spans)
 
 test_inputs = [
     """Here is a task.
@@ -67,7 +92,18 @@ test_inputs = [
     """Nested { "a": { "b": 1 } } works?"""
 ]
 
-with open("json_removal_output.txt", "w") as f:
-    for t in test_inputs:
-        f.write(f"--- Input ---\n{t}\n")
-        f.write(f"--- Output ---\n{remove_json_structures(t)}\n\n")
+# Below this much input, starting worker processes costs more than the scan
+PARALLEL_MIN_CHARS = 1_000_000
+
+def strip_all(inputs):
+    if sum(map(len, inputs)) < PARALLEL_MIN_CHARS:
+        return list(map(remove_json_structures, inputs))
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(remove_json_structures, inputs))
+
+if __name__ == "__main__":
+    parts = []
+    for t, result in zip(test_inputs, strip_all(test_inputs)):
+        parts.append(f"--- Input ---\n{t}\n")
+        parts.append(f"--- Output ---\n{result}\n\n")
+    Path("json_removal_output.txt").write_bytes("".join(parts).encode("utf-8"))
@@ -6,6 +6,6 @@ async def start_task(
 ):
     """Start a task (initial start or retry)."""
     result = await planner_service.start_task(str(current_user.id), task_id)
-    if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
+    if result is None:
+        raise HTTPException(status_code=404, detail="Task not found or not owned")
     return result
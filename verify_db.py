@@ -1,19 +1,34 @@
 
 import sqlite3
 import os
+from pathlib import Path
 
 DB_PATH = os.path.join("backend", "concierge.db")
+TABLES = ("goals", "plans")
 
 with open("verification_result.txt", "w", encoding="utf-8") as f:
     f.write(f"Checking {DB_PATH}\n")
     if not os.path.exists(DB_PATH):
         f.write("DB not found\n")
     else:
-        conn = sqlite3.connect(DB_PATH)
+        # Read-only: the check must never create or modify the database
+        conn = sqlite3.connect(f"{Path(DB_PATH).resolve().as_uri()}?mode=ro", uri=True)
         cursor = conn.cursor()
         try:
-            cursor.execute("PRAGMA table_info(goals);")
-            columns = [row[1] for row in cursor.fetchall()]
+            cursor.execute("PRAGMA mmap_size=268435456;")
+            # Both schemas in one round trip, in column order; table names
+            # are bound parameters of pragma_table_info, not formatted in
+            cursor.execute(
+                f"WITH t(name) AS (VALUES {', '.join(['(?)'] * len(TABLES))}) "
+                "SELECT t.name, p.name FROM t JOIN pragma_table_info(t.name) p "
+                "ORDER BY t.name, p.cid;",
+                TABLES,
+            )
+            table_columns = {table: [] for table in TABLES}
+            for table, column in cursor.fetchall():
+                table_columns[table].append(column)
+
+            columns = table_columns["goals"]
             f.write(f"Goal columns: {columns}\n")
             
             if "is_tracked" in columns:
@@ -21,8 +36,7 @@ with open("verification_result.txt", "w", encoding="utf-8") as f:
             else:
                 f.write("FAILURE: is_tracked NOT found in goals\n")
                 
-            cursor.execute("PRAGMA table_info(plans);")
-            plan_cols = [row[1] for row in cursor.fetchall()]
+            plan_cols = table_columns["plans"]
             if "goal_id" in plan_cols:
                  f.write("SUCCESS: goal_id found in plans\n")
             else: